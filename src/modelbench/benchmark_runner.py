@@ -14,14 +14,14 @@ from tqdm import tqdm
 
 from modelbench.benchmark_runner_items import ModelgaugeTestWrapper, TestRunItem, Timer
 from modelbench.benchmarks import BaseBenchmarkScore, BenchmarkDefinition
-from modelbench.cache import DiskCache, MBCache
+from modelbench.cache import DiskCache, InMemoryCache, MBCache, NullCache
 from modelbench.run_journal import RunJournal
 from modelgauge.annotator import Annotator
 from modelgauge.annotator_registry import ANNOTATORS
 from modelgauge.base_test import PromptResponseTest, TestResult
 from modelgauge.config import raise_if_missing_from_config
 from modelgauge.monitoring import PROMETHEUS
-from modelgauge.pipeline import NullCache, Pipe, Pipeline, Sink, Source
+from modelgauge.pipeline import Pipe, Pipeline, Sink, Source
 from modelgauge.pipeline_runner import PipelineRunner
 from modelgauge.records import TestRecord
 from modelgauge.single_turn_prompt_response import TestItem
@@ -186,7 +186,9 @@ class TestRunBase:
         if self.data_dir:
             result = DiskCache(self.data_dir / cache_name)
         else:
-            result = NullCache()
+            # No run directory to persist to, but still worth deduplicating repeated
+            # SUT/annotator requests within the process.
+            result = InMemoryCache()
 
         self.caches[cache_name] = result
         self.cache_starting_size[cache_name] = len(result)
@@ -23,6 +23,8 @@ class JournalSearch:
     def __init__(self, journal_path):
         self.journal_path = journal_path
         self.message_entries: Dict[str, List] = defaultdict(list)  # or maybe sqllite dict?
+        # Many checks issue the same query; cache results keyed on the query args.
+        self._query_cache: Dict[tuple, List] = {}
         # Load journal into message_entries dict.
         self._read_journal()
 
@@ -34,18 +36,21 @@ class JournalSearch:
                 self.message_entries[entry["message"]].append(entry)
 
     def query(self, message: str, **kwargs):
-        messages = self.message_entries[message]
-        return [m for m in messages if all(m[k] == v for k, v in kwargs.items())]
+        cache_key = (message, tuple(sorted(kwargs.items())))
+        results = self._query_cache.get(cache_key)
+        if results is None:
+            messages = self.message_entries[message]
+            results = [m for m in messages if all(m[k] == v for k, v in kwargs.items())]
+            self._query_cache[cache_key] = results
+        return results
 
     def num_test_prompts(self, test) -> int:
-        # TODO: Implement cache.
         test_entry = self.query("using test items", test=test)
         assert len(test_entry) == 1, "Only 1 `using test items` entry expected per test but found multiple."
         return test_entry[0]["using"]
 
     def test_prompt_uids(self, test) -> List[str]:
         """Returns all prompt UIDs queue"""
-        # TODO: Implement cache.
         return [item["prompt_id"] for item in self.query("queuing item", test=test)]
 
     def sut_response_prompt_uids_for_test(self, sut, test) -> List[str]:
@@ -1,5 +1,6 @@
 import warnings
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import List, Mapping
 
 import casefy
@@ -39,9 +40,9 @@ class HazardDefinition(ABC, HasUid):
     def score(self, sut_scores: Mapping[str, TestRecord]) -> "HazardScore":
         pass
 
-    @property
+    @cached_property
     def reference_key(self):
-        """Key for standard score lookup."""
+        """Key for standard score lookup. Computed once per instance; lookups happen in scoring loops."""
         return casefy.snakecase(self.__class__.__name__.replace(HazardDefinition.__name__, ""))
 
     def tests(self, secrets: RawSecrets) -> List[PromptResponseTest]:
@@ -88,7 +89,7 @@ class SafeHazardV1(HazardDefinition):
         self._evaluator = evaluator
         super().__init__()
 
-    @property
+    @cached_property
     def reference_key(self):
         return f"safe_hazard-1_1-{self.hazard_key}"
 
@@ -162,7 +163,7 @@ class BaseSecurityHazard(HazardDefinition, ABC):
     def test_uids(self) -> List[str]:
         pass
 
-    @property
+    @cached_property
     def reference_key(self):
         # Both jailbreak and naive hazards use the naive reference score.
         return f"security_naive_official_hazard-{self.VERSION.replace('.','_')}"
@@ -8,6 +8,11 @@ from typing import Sequence
 
 import pydantic
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 from modelbench.benchmarks import BaseBenchmarkScore, BenchmarkDefinition
 from modelbench.hazards import HazardDefinition, HazardScore
 from modelgauge.base_test import BaseTest
@@ -83,14 +88,21 @@ def dump_json(
     user: str | None = None,
 ):
     _run_uid = run_uid if run_uid else f"run-{benchmark.uid}-{start_time.strftime('%Y%m%d-%H%M%S')}"
-    with open(json_path, "w") as f:
-        output = {
-            "_metadata": benchmark_metadata(user),
-            "benchmark": (benchmark),
-            "run_uid": _run_uid,
-            "scores": (benchmark_scores),
-        }
-        json.dump(output, f, cls=BenchmarkScoreEncoder, indent=4)
+    output = {
+        "_metadata": benchmark_metadata(user),
+        "benchmark": (benchmark),
+        "run_uid": _run_uid,
+        "scores": (benchmark_scores),
+    }
+    if orjson is not None:
+        # OPT_PASSTHROUGH_DATETIME routes datetimes through the encoder's default so both
+        # branches write the same str() form. Indentation differs (2 vs 4 spaces); record
+        # consumers parse the JSON, so only the content needs to match.
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        json_path.write_bytes(orjson.dumps(output, default=BenchmarkScoreEncoder().default, option=option))
+    else:
+        with open(json_path, "w") as f:
+            json.dump(output, f, cls=BenchmarkScoreEncoder, indent=4)
 
 
 class BenchmarkScoreEncoder(json.JSONEncoder):
@@ -3,6 +3,7 @@ import os
 import shutil
 import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Mapping, Optional
 
 from pydantic import BaseModel, Field
@@ -11,6 +12,8 @@ from modelgauge.data_packing import DataUnpacker
 from modelgauge.external_data import ExternalData
 from modelgauge.general import current_timestamp_millis, hash_file, normalize_filename
 
+_MAX_PARALLEL_DOWNLOADS = 4
+
 
 class DependencyHelper(ABC):
     """Interface for managing the versions of external data dependencies."""
@@ -100,11 +103,14 @@ class FromSourceDependencyHelper(DependencyHelper):
         return self.used_dependencies
 
     def update_all_dependencies(self):
-        latest_versions = {}
-        for dependency_key, external_data in self.dependencies.items():
-            normalized_key = normalize_filename(dependency_key)
-            latest_versions[dependency_key] = self._store_dependency(normalized_key, external_data)
-        return latest_versions
+        """Download all dependencies, fanning out so fetches overlap on the network."""
+
+        def store(dependency_key: str) -> str:
+            return self._store_dependency(normalize_filename(dependency_key), self.dependencies[dependency_key])
+
+        keys = list(self.dependencies.keys())
+        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_DOWNLOADS) as executor:
+            return dict(zip(keys, executor.map(store, keys)))
 
     def _ensure_required_version_exists(
         self,
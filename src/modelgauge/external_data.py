@@ -1,15 +1,23 @@
 import requests  # type: ignore
 import shutil
 import tempfile
+from requests.adapters import HTTPAdapter  # type: ignore
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Dict, Optional
 
-import gdown  # type: ignore
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from modelgauge.data_packing import DataDecompressor, DataUnpacker
 
+# Shared across all WebData downloads so parallel fetches reuse pooled
+# keep-alive connections. requests.Session is thread-safe for plain gets.
+# The adapter is sized so each download worker can hold its own connection.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
 
 @dataclass(frozen=True, kw_only=True)
 class ExternalData(ABC):
@@ -32,6 +40,8 @@ class WebData(ExternalData):
     source_url: str
     headers: Optional[Dict] = None
 
+    CHUNK_SIZE = 1024 * 1024
+
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=1, min=1),
@@ -39,12 +49,14 @@ class WebData(ExternalData):
     )
     def download(self, location):
         if self.headers:
-            response = requests.get(self.source_url, headers=self.headers)
+            response = _SESSION.get(self.source_url, headers=self.headers, stream=True)
         else:
-            response = requests.get(self.source_url)
+            response = _SESSION.get(self.source_url, stream=True)
         if response.ok:
+            # Stream to disk so large files aren't buffered whole in memory.
             with open(location, "wb") as f:
-                f.write(response.content)
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    f.write(chunk)
         else:
             raise RuntimeError(
                 f"failed to fetch {self.source_url} with headers={self.headers}.\nResponse status: {response.status_code}: {response.text}"
@@ -64,6 +76,9 @@ class GDriveData(ExternalData):
         reraise=True,
     )
     def download(self, location):
+        # Deferred import: gdown is slow to import and only needed for Google Drive sources.
+        import gdown  # type: ignore
+
         with tempfile.TemporaryDirectory() as tmpdir:
             # Empty folder downloaded to tmpdir
             available_files = gdown.download_folder(url=self.data_source, skip_download=True, quiet=True, output=tmpdir)
@@ -99,7 +99,8 @@ class InstanceFactory(Generic[_T]):
 
     def knows(self, uid: str) -> bool:
         """Check if the factory knows about a given uid."""
-        return uid in self.keys()
+        with self.lock:
+            return uid in self._lookup
 
     def compact_uid_list(self) -> str:
         valid_uids = sorted(list(self._lookup.keys()), key=lambda x: x.lower())
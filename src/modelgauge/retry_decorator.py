@@ -1,4 +1,6 @@
+import asyncio
 import functools
+import inspect
 import time
 
 from airrlogger.log_config import get_logger
@@ -21,11 +23,46 @@ def retry(
     A decorator that retries a function at least base_retry_count times.
     If do_not_retry_exceptions are specified, it will not retry if any of those exceptions occur.
     If transient_exceptions are specified, it will retry for up to 1 day if any of those exceptions occur.
+    Works on both regular functions and coroutine functions.
     """
     do_not_retry_exceptions = tuple(do_not_retry_exceptions) if do_not_retry_exceptions else ()
     transient_exceptions = tuple(transient_exceptions) if transient_exceptions else ()
 
+    def backoff_or_reraise(e, attempt, start_time):
+        """Return the backoff before the next attempt, or re-raise e if retries are exhausted."""
+        if isinstance(e, do_not_retry_exceptions):
+            raise e
+        if isinstance(e, transient_exceptions):
+            # Keep retrying transient exceptions for 1 day.
+            elapsed_time = time.time() - start_time
+            if elapsed_time >= max_retry_duration:
+                raise e
+            logger.warning(f"Transient exception occurred: {e}. Retrying...")
+        else:
+            # Retry all other exceptions BASE_RETRY_COUNT times.
+            if attempt >= base_retry_count:
+                raise e
+            logger.warning(f"Exception occurred after {attempt}/{base_retry_count} attempts: {e}. Retrying...")
+        return min(2**attempt, max_backoff)  # Exponential backoff with cap
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                attempt = 0
+                start_time = time.time()
+
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if not isinstance(e, transient_exceptions):
+                            attempt += 1
+                        await asyncio.sleep(backoff_or_reraise(e, attempt, start_time))
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             attempt = 0
@@ -34,22 +71,10 @@ def retry(
             while True:
                 try:
                     return func(*args, **kwargs)
-                except do_not_retry_exceptions as e:
-                    raise
-                except transient_exceptions as e:
-                    # Keep retrying transient exceptions for 1 day.
-                    elapsed_time = time.time() - start_time
-                    if elapsed_time >= max_retry_duration:
-                        raise
-                    logger.warning(f"Transient exception occurred: {e}. Retrying...")
                 except Exception as e:
-                    # Retry all other exceptions BASE_RETRY_COUNT times.
-                    attempt += 1
-                    if attempt >= base_retry_count:
-                        raise
-                    logger.warning(f"Exception occurred after {attempt}/{base_retry_count} attempts: {e}. Retrying...")
-                sleep_time = min(2**attempt, max_backoff)  # Exponential backoff with cap
-                time.sleep(sleep_time)
+                    if not isinstance(e, transient_exceptions):
+                        attempt += 1
+                    time.sleep(backoff_or_reraise(e, attempt, start_time))
 
         return wrapper
 
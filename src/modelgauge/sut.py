@@ -1,3 +1,4 @@
+import asyncio
 from abc import abstractmethod
 from typing import Optional, Sequence, Type
 
@@ -85,6 +86,15 @@ class PromptResponseSUT(SUT, Readyable):
         """Evaluate this SUT on the native request."""
         pass
 
+    async def aevaluate(self, request):
+        """Async counterpart to `evaluate`.
+
+        The default runs the blocking `evaluate` in a worker thread so it does not
+        stall the event loop; SUTs with a native async client should override this.
+        Callers are responsible for bounding concurrency (e.g. with a semaphore).
+        """
+        return await asyncio.to_thread(self.evaluate, request)
+
     @abstractmethod
     def translate_response(self, request, response) -> SUTResponse:
         """Convert the native response into a form all Tests can process."""
@@ -33,6 +33,18 @@ class AcceptsChatPrompt(SUTCapability):
         return "These SUTs can take a `ChatPrompt` as input."
 
 
+class SupportsBatchEvaluation(SUTCapability):
+    """The capability to evaluate many native requests in one call.
+
+    SUTs that report this capability must implement `batch_evaluate()`, letting callers
+    hand the backend enough concurrent requests for it to batch them server-side.
+    """
+
+    @classmethod
+    def description(cls) -> str:
+        return "These SUTs can evaluate a list of native requests via `batch_evaluate()`."
+
+
 class ProducesPerTokenLogProbabilities(SUTCapability):
     """The capability to produce per-token log probabilities.
 
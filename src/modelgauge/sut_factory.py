@@ -169,7 +169,7 @@ class SUTFactory:
             raise SUTNotFoundException(f"{uid} is neither pre-registered nor a valid dynamic SUT UID.")
 
     def _classify_sut_uid(self, uid: str) -> SUTType:
-        if uid in self.sut_registry.keys():
+        if self.sut_registry.knows(uid):
             return SUTType.KNOWN
         elif ":" in uid:
             return SUTType.DYNAMIC
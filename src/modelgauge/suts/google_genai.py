@@ -2,6 +2,7 @@
 This file defines google SUTs that use Google's genai python SDK.
 """
 
+import threading
 from typing import Optional
 
 from airrlogger.log_config import get_logger
@@ -58,6 +59,7 @@ class GoogleGenAiSUT(PromptResponseSUT):
         self.client: Optional[genai.Client] = None
         self.reasoning = reasoning
         self.api_key = api_key.value
+        self._client_lock = threading.Lock()
 
     def _load_client(self) -> genai.Client:
         try:
@@ -66,6 +68,14 @@ class GoogleGenAiSUT(PromptResponseSUT):
             logger.exception(f"Failed to load genai.Client with api_key='{loggable_secret(self.api_key)}'")
             raise
 
+    def _client_or_load(self) -> genai.Client:
+        """Lazily initialize the client exactly once, even with many worker threads evaluating."""
+        if self.client is None:
+            with self._client_lock:
+                if self.client is None:
+                    self.client = self._load_client()
+        return self.client
+
     def translate_text_prompt(self, prompt: TextPrompt, options: ModelOptions) -> GenAiRequest:
         optional = {}
         if not self.reasoning:
@@ -82,7 +92,8 @@ class GoogleGenAiSUT(PromptResponseSUT):
             frequency_penalty=options.frequency_penalty,
             **optional,
         )
-        return GenAiRequest(
+        # The config is already a validated SDK model; skip re-validating the wrapper per prompt.
+        return GenAiRequest.model_construct(
             model=self.model_name,
             contents=prompt.text,
             config=generation_config,
@@ -90,10 +101,18 @@ class GoogleGenAiSUT(PromptResponseSUT):
 
     @retry(transient_exceptions=[InternalServerError, ResourceExhausted, RetryError, TooManyRequests])
     def evaluate(self, request: GenAiRequest) -> GenerateContentResponse:
-        if self.client is None:
-            # Handle lazy init.
-            self.client = self._load_client()
-        return self.client.models.generate_content(**request.model_dump(exclude_none=True))
+        client = self._client_or_load()
+        # Pass fields through directly; round-tripping the config through model_dump
+        # allocates a fresh dict tree per prompt and the SDK accepts the config object as-is.
+        return client.models.generate_content(model=request.model, contents=request.contents, config=request.config)
+
+    @retry(transient_exceptions=[InternalServerError, ResourceExhausted, RetryError, TooManyRequests])
+    async def aevaluate(self, request: GenAiRequest) -> GenerateContentResponse:
+        """Async counterpart to `evaluate`, using the SDK's async client surface."""
+        client = self._client_or_load()
+        return await client.aio.models.generate_content(
+            model=request.model, contents=request.contents, config=request.config
+        )
 
     def translate_response(self, request: GenAiRequest, response: GenerateContentResponse) -> SUTResponse:
         if response.candidates is None or len(response.candidates) == 0:
@@ -114,7 +133,8 @@ class GoogleGenAiSUT(PromptResponseSUT):
                 )
         else:
             raise AssertionError(f"Expected a single candidate in the response, got {response.candidates}.")
-        return SUTResponse(text=response_text)
+        # response_text is already a validated str (or the refusal constant); skip re-validation.
+        return SUTResponse.model_construct(text=response_text)
 
 
 for model in ["gemini-2.5-flash-preview-09-2025"]:
@@ -321,6 +321,33 @@ def test_dump_json(benchmark_score, tmp_path, run_uid):
     assert len(j["scores"]) == 1
 
 
+def test_dump_json_output_independent_of_json_library(end_time, sut, tmp_path):
+    # The record content must not depend on which JSON library happens to be importable.
+    # Indentation may differ between the branches; the parsed content may not.
+    pytest.importorskip("orjson")
+
+    def dump_and_parse(path):
+        # Serializing a score mutates it (numeric_grade() updates self.score), so each
+        # dump needs a fresh score object for the outputs to be comparable.
+        score = benchmark_score_gen(end_time, sut)
+        with mock.patch("modelbench.record.benchmark_metadata", lambda user=None: {"format_version": 1}):
+            dump_json(
+                path,
+                datetime.fromtimestamp(1700000000, timezone.utc),
+                score.benchmark_definition,
+                [score],
+                None,
+            )
+        with open(path) as f:
+            return json.load(f)
+
+    orjson_record = dump_and_parse(tmp_path / "orjson.json")
+    with mock.patch("modelbench.record.orjson", None):
+        stdlib_record = dump_and_parse(tmp_path / "stdlib.json")
+
+    assert orjson_record == stdlib_record
+
+
 def test_dump_json_user(benchmark_score, tmp_path):
 
     def dump_and_read_record(**kwargs):
@@ -294,17 +294,25 @@ class TestCli:
     def run_dir(self, tmp_path):
         return tmp_path
 
-    @pytest.fixture
-    def runner(self, run_dir):
-        runner = CliRunner()
+    @pytest.fixture(scope="class")
+    def cli_runner(self):
+        # One CliRunner for the whole class; each invoke() call is already isolated,
+        # so there's no need to build a fresh runner per test case.
+        return CliRunner()
 
+    @pytest.fixture
+    def runner(self, cli_runner, run_dir):
         def invoke(command, args=None, **kwargs):
             args = list(args or [])
             full_args = ["--run-path", run_dir] + args
-            return runner.invoke(command, full_args, **kwargs)
+            return cli_runner.invoke(command, full_args, **kwargs)
 
         return invoke
 
+    @pytest.fixture
+    def pass_consistency_check(self, monkeypatch):
+        monkeypatch.setattr(modelbench.cli, "run_consistency_check", lambda *args, **kwargs: True)
+
     @pytest.mark.parametrize(
         "version,locale,prompt_set",
         [
@@ -319,10 +327,10 @@ class TestCli:
     @pytest.mark.parametrize("sut_uid", ["fake-sut", "google/gemma-3-27b-it:scaleway:hfrelay"])
     def test_benchmark_basic_run_produces_json(
         self,
-        monkeypatch,
         runner,
         mock_run_benchmarks,
         mock_score_benchmarks,
+        pass_consistency_check,
         sut_uid,
         version,
         locale,
@@ -348,7 +356,6 @@ class TestCli:
             sut_uid,
             *benchmark_options,
         ]
-        monkeypatch.setattr(modelbench.cli, "run_consistency_check", lambda *args, **kwargs: True)
         result = runner(
             cli,
             command_options,
@@ -398,7 +405,16 @@ class TestCli:
     )
     @pytest.mark.parametrize("sut_uid", ["fake-sut", "google/gemma-3-27b-it:scaleway:hfrelay;mt=500;t=0.3"])
     def test_benchmark_multiple_suts_produces_json(
-        self, mock_run_benchmarks, runner, version, locale, prompt_set, sut_uid, run_dir, monkeypatch
+        self,
+        mock_run_benchmarks,
+        runner,
+        pass_consistency_check,
+        version,
+        locale,
+        prompt_set,
+        sut_uid,
+        run_dir,
+        monkeypatch,
     ):
 
         benchmark_options = ["--version", version]
@@ -414,7 +430,6 @@ class TestCli:
 
         mock = MagicMock(return_value=[self.mock_score(sut_uid, benchmark), self.mock_score("demo_yes_no", benchmark)])
         monkeypatch.setattr(modelbench.cli, "score_benchmarks", mock)
-        monkeypatch.setattr(modelbench.cli, "run_consistency_check", lambda *args, **kwargs: True)
 
         result = runner(
             cli,
@@ -602,6 +617,7 @@ class TestCli:
         self,
         runner,
         mock_score_benchmarks,
+        pass_consistency_check,
         sut_uid,
         sut,
         locale,
@@ -622,7 +638,6 @@ class TestCli:
             return_value=fake_benchmark_run(reference_benchmark, reference_benchmark.hazards(), sut, tmp_path)
         )
         monkeypatch.setattr(modelbench.cli, "run_benchmarks_for_sut", mock)
-        monkeypatch.setattr(modelbench.cli, "run_consistency_check", lambda *args, **kwargs: True)
 
         benchmark_options = []
         if locale is not None:
@@ -654,6 +669,7 @@ class TestCli:
         self,
         runner,
         mock_score_security_benchmarks,
+        pass_consistency_check,
         sut_uid,
         sut,
         standards_path_patch,
@@ -675,7 +691,6 @@ class TestCli:
             return_value=fake_benchmark_run(reference_benchmark, reference_benchmark.hazards(), sut, tmp_path)
         )
         monkeypatch.setattr(modelbench.cli, "run_benchmarks_for_sut", mock)
-        monkeypatch.setattr(modelbench.cli, "run_consistency_check", lambda *args, **kwargs: True)
 
         benchmark_options = []
         if locale is not None:
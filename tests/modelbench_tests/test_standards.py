@@ -1,10 +1,13 @@
 import json
+import os
 import pathlib
+import time
 from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
 
+import modelbench.standards
 from modelbench.cli import calibrate, run_benchmarks_for_sut
 from modelbench.hazards import HazardDefinition, HazardScore
 from modelbench.scoring import ValueEstimate
@@ -105,6 +108,35 @@ class TestStandards:
         standards = Standards.from_file(file)
         assert standards.reference_standard_for(hazard) == 0.8
 
+    def test_from_file_caches_parse(self, tmp_path, hazard):
+        file = tmp_path / "benchmark_standards.json"
+        standards = {"reference_standards": {hazard.reference_key: 0.8}}
+        with open(file, "w") as out:
+            json.dump({"standards": standards, "_metadata": {"run_info": {}}}, out)
+
+        Standards.from_file(file)
+        with patch(
+            "modelbench.standards._parse_standards_file", wraps=modelbench.standards._parse_standards_file
+        ) as mock_parse:
+            standards = Standards.from_file(file)
+            mock_parse.assert_not_called()
+        assert standards.reference_standard_for(hazard) == 0.8
+
+    def test_from_file_rereads_changed_file(self, tmp_path, hazard):
+        file = tmp_path / "benchmark_standards.json"
+        standards = {"reference_standards": {hazard.reference_key: 0.8}}
+        with open(file, "w") as out:
+            json.dump({"standards": standards, "_metadata": {"run_info": {}}}, out)
+        assert Standards.from_file(file).reference_standard_for(hazard) == 0.8
+
+        standards = {"reference_standards": {hazard.reference_key: 0.5}}
+        with open(file, "w") as out:
+            json.dump({"standards": standards, "_metadata": {"run_info": {}}}, out)
+        # Back-to-back writes can land in the same mtime tick on coarse-timestamp
+        # filesystems; force a distinct mtime so the cache sees the rewrite.
+        os.utime(file, ns=(time.time_ns(), file.stat().st_mtime_ns + 1))
+        assert Standards.from_file(file).reference_standard_for(hazard) == 0.5
+
     def test_from_runs(self):
         hazard_1 = DummyHazard(key="h1")
         hazard_2 = DummyHazard2(key="h2")
@@ -1,5 +1,6 @@
+import asyncio
 import json
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from google.genai.types import GenerateContentConfig, GenerateContentResponse, ThinkingConfig, FinishReason
@@ -120,34 +121,36 @@ def test_google_genai_evaluate_lazy_loads_model(mock_load_model, mock_model, goo
     assert google_default_sut.client is not None
 
 
-def test_google_genai_evaluate_excludes_none_options(mock_model, google_default_sut):
+def test_google_genai_evaluate_passes_request_fields(mock_model, google_default_sut):
     google_default_sut.client = mock_model
-    request = GenAiRequest(
-        model=_MODEL_NAME,
-        contents="some-text",
-        config=GenerateContentConfig(stop_sequences=None, max_output_tokens=200, temperature=0.5),
-    )
+    config = GenerateContentConfig(stop_sequences=None, max_output_tokens=200, temperature=0.5)
+    request = GenAiRequest(model=_MODEL_NAME, contents="some-text", config=config)
 
     google_default_sut.evaluate(request)
 
-    mock_model.models.generate_content.assert_called_with(
-        model=_MODEL_NAME, contents="some-text", config={"max_output_tokens": 200, "temperature": 0.5}
-    )
+    mock_model.models.generate_content.assert_called_with(model=_MODEL_NAME, contents="some-text", config=config)
 
 
 def test_google_genai_evaluate_unreasoning(mock_model, google_unreasoning_sut):
     google_unreasoning_sut.client = mock_model
-    request = GenAiRequest(
-        model=_MODEL_NAME,
-        contents="some-text",
-        config=GenerateContentConfig(thinking_config=ThinkingConfig(thinking_budget=0)),
-    )
+    config = GenerateContentConfig(thinking_config=ThinkingConfig(thinking_budget=0))
+    request = GenAiRequest(model=_MODEL_NAME, contents="some-text", config=config)
 
     google_unreasoning_sut.evaluate(request)
 
-    mock_model.models.generate_content.assert_called_with(
-        model=_MODEL_NAME, contents="some-text", config={"thinking_config": {"thinking_budget": 0}}
-    )
+    mock_model.models.generate_content.assert_called_with(model=_MODEL_NAME, contents="some-text", config=config)
+
+
+def test_google_genai_aevaluate(mock_model, google_default_sut, fake_raw_response):
+    mock_model.aio.models.generate_content = AsyncMock(return_value=fake_raw_response)
+    google_default_sut.client = mock_model
+    config = GenerateContentConfig(stop_sequences=None, max_output_tokens=200, temperature=0.5)
+    request = GenAiRequest(model=_MODEL_NAME, contents="some-text", config=config)
+
+    response = asyncio.run(google_default_sut.aevaluate(request))
+
+    mock_model.aio.models.generate_content.assert_called_with(model=_MODEL_NAME, contents="some-text", config=config)
+    assert response == fake_raw_response
 
 
 def test_google_genai_translate_response(google_default_sut, fake_raw_response, some_request):
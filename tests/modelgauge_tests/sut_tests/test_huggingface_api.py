@@ -1,5 +1,8 @@
+import asyncio
+import json
+
 import pytest
-from unittest.mock import ANY, patch
+from unittest.mock import AsyncMock, patch
 
 from modelgauge.auth.huggingface_inference_token import HuggingFaceInferenceToken
 from modelgauge.prompt import TextPrompt
@@ -39,6 +42,7 @@ def mocked_requests_post(response_text):
         def __init__(self, json_data, status_code):
             self.json_data = json_data
             self.status_code = status_code
+            self.content = json.dumps([json_data]).encode()
 
         def json(self):
             return [self.json_data]
@@ -46,7 +50,13 @@ def mocked_requests_post(response_text):
     return MockResponse({"generated_text": response_text}, 200)
 
 
-@patch("requests.post")
+def test_huggingface_api_session_headers(fake_sut):
+    assert fake_sut._session.headers["Authorization"] == "Bearer fake_token"
+    assert fake_sut._session.headers["Accept"] == "application/json"
+    assert fake_sut._session.headers["Content-Type"] == "application/json"
+
+
+@patch("requests.Session.post")
 def test_huggingface_api_evaluate_receives_correct_args(mock_post, fake_sut):
     mock_post.return_value = mocked_requests_post("doesn't matter")
     prompt_text = "some text prompt"
@@ -57,12 +67,11 @@ def test_huggingface_api_evaluate_receives_correct_args(mock_post, fake_sut):
 
     mock_post.assert_called_with(
         "https://fake_url.com",
-        headers=ANY,
-        json={"inputs": prompt_text, "parameters": sut_options},
+        data=sut_request.model_dump_json(exclude_none=True),
     )
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_huggingface_api_evaluate_dumps_result(mock_post, fake_sut):
     response_text = "some response"
     mock_post.return_value = mocked_requests_post(response_text)
@@ -72,6 +81,82 @@ def test_huggingface_api_evaluate_dumps_result(mock_post, fake_sut):
     assert output == HuggingFaceResponse(generated_text=response_text)
 
 
+@patch("huggingface_hub.AsyncInferenceClient")
+def test_huggingface_api_aevaluate(mock_client_cls, fake_sut):
+    mock_client = mock_client_cls.return_value
+    mock_client.text_generation = AsyncMock(return_value="some response")
+    sut_request = _make_sut_request("some text prompt", max_new_tokens=5, temperature=1.0)
+
+    output = asyncio.run(fake_sut.aevaluate(sut_request))
+
+    mock_client_cls.assert_called_once_with(model="https://fake_url.com", token="fake_token")
+    mock_client.text_generation.assert_called_once_with("some text prompt", max_new_tokens=5, temperature=1.0)
+    assert output == HuggingFaceResponse(generated_text="some response")
+
+
+@patch("huggingface_hub.AsyncInferenceClient")
+def test_huggingface_api_aevaluate_reuses_client_within_loop(mock_client_cls, fake_sut):
+    mock_client = mock_client_cls.return_value
+    mock_client.text_generation = AsyncMock(return_value="some response")
+    sut_request = _make_sut_request("some text prompt")
+
+    async def evaluate_twice():
+        await fake_sut.aevaluate(sut_request)
+        await fake_sut.aevaluate(sut_request)
+
+    asyncio.run(evaluate_twice())
+
+    mock_client_cls.assert_called_once()
+
+
+@patch("huggingface_hub.AsyncInferenceClient")
+def test_huggingface_api_aevaluate_makes_new_client_per_loop(mock_client_cls, fake_sut):
+    # The client's connections are bound to the loop it was created on, so reusing it
+    # on a later loop (e.g. the next batch_evaluate call) would fail.
+    mock_client = mock_client_cls.return_value
+    mock_client.text_generation = AsyncMock(return_value="some response")
+    sut_request = _make_sut_request("some text prompt")
+
+    asyncio.run(fake_sut.aevaluate(sut_request))
+    asyncio.run(fake_sut.aevaluate(sut_request))
+
+    assert mock_client_cls.call_count == 2
+
+
+@patch("huggingface_hub.AsyncInferenceClient")
+def test_huggingface_api_batch_evaluate(mock_client_cls, fake_sut):
+    mock_client = mock_client_cls.return_value
+    mock_client.text_generation = AsyncMock(side_effect=["response 1", "response 2"])
+    mock_client.close = AsyncMock()
+    sut_requests = [_make_sut_request("prompt 1"), _make_sut_request("prompt 2")]
+
+    outputs = fake_sut.batch_evaluate(sut_requests)
+
+    assert outputs == [
+        HuggingFaceResponse(generated_text="response 1"),
+        HuggingFaceResponse(generated_text="response 2"),
+    ]
+    mock_client.close.assert_awaited_once()
+
+
+@patch("huggingface_hub.AsyncInferenceClient")
+def test_huggingface_api_consecutive_batch_evaluates(mock_client_cls, fake_sut):
+    # The runner calls batch_evaluate once per --batch-size chunk; each call runs its
+    # own event loop, so the second batch must not reuse the first batch's client, and
+    # each batch must close its client before its loop goes away.
+    mock_client = mock_client_cls.return_value
+    mock_client.text_generation = AsyncMock(side_effect=["response 1", "response 2"])
+    mock_client.close = AsyncMock()
+
+    first = fake_sut.batch_evaluate([_make_sut_request("prompt 1")])
+    second = fake_sut.batch_evaluate([_make_sut_request("prompt 2")])
+
+    assert first == [HuggingFaceResponse(generated_text="response 1")]
+    assert second == [HuggingFaceResponse(generated_text="response 2")]
+    assert mock_client_cls.call_count == 2
+    assert mock_client.close.await_count == 2
+
+
 def test_huggingface_chat_completion_translate_response(fake_sut):
     sut_request = _make_sut_request("doesn't matter")
     evaluate_output = HuggingFaceResponse(generated_text="response")
@@ -9,22 +9,31 @@ from unittest.mock import ANY
 from tenacity import wait_none
 
 
-WebDataMockResponse = namedtuple("WebDataMockResponse", ("ok", "content"))
 GDriveFileToDownload = namedtuple("GDriveFileToDownload", ("id", "path"))
 
 
+class WebDataMockResponse:
+    def __init__(self, ok=True, content=b"test"):
+        self.ok = ok
+        self.content = content
+
+    def iter_content(self, chunk_size=None):
+        yield self.content
+
+
 def test_web_data_download(mocker, tmpdir):
-    mock_download = mocker.patch("requests.get", return_value=WebDataMockResponse(ok=True, content=b"test"))
+    mock_download = mocker.patch("requests.Session.get", return_value=WebDataMockResponse(ok=True, content=b"test"))
     web_data = WebData(source_url="http://example.com")
     web_data.download(tmpdir / "file.txt")
-    mock_download.assert_called_once_with("http://example.com")
+    mock_download.assert_called_once_with("http://example.com", stream=True)
+    assert (tmpdir / "file.txt").read_binary() == b"test"
 
 
 def test_web_data_download_with_headers(mocker, tmpdir):
-    mock_download = mocker.patch("requests.get", return_value=WebDataMockResponse(ok=True, content=b"test"))
+    mock_download = mocker.patch("requests.Session.get", return_value=WebDataMockResponse(ok=True, content=b"test"))
     web_data = WebData(source_url="http://example.com", headers={"token": "secret"})
     web_data.download(tmpdir / "file.txt")
-    mock_download.assert_called_once_with("http://example.com", headers={"token": "secret"})
+    mock_download.assert_called_once_with("http://example.com", headers={"token": "secret"}, stream=True)
 
 
 def test_gdrive_data_download(mocker):
@@ -1,3 +1,4 @@
+import asyncio
 import time
 from unittest.mock import patch
 
@@ -79,3 +80,48 @@ def test_retry_does_not_retry():
     with pytest.raises(ValueError):
         always_fail()
     assert attempt_counter == 1
+
+
+def test_retry_async_eventually_succeeds():
+    attempt_counter = 0
+
+    @retry(transient_exceptions=[ValueError])
+    async def succeed_before_base_retry_total():
+        nonlocal attempt_counter
+        attempt_counter += 1
+        if attempt_counter < BASE_RETRY_COUNT:
+            raise ValueError("Intentional failure")
+        return "success"
+
+    with patch("asyncio.sleep") as patched_sleep:
+        assert asyncio.run(succeed_before_base_retry_total()) == "success"
+    assert attempt_counter == BASE_RETRY_COUNT
+
+
+def test_retry_async_fails_after_base_retries():
+    attempt_counter = 0
+
+    @retry(max_retry_duration=3)
+    async def always_fail():
+        nonlocal attempt_counter
+        attempt_counter += 1
+        raise KeyError("Intentional failure")
+
+    with pytest.raises(KeyError):
+        with patch("asyncio.sleep") as patched_sleep:
+            asyncio.run(always_fail())
+    assert attempt_counter == BASE_RETRY_COUNT
+
+
+def test_retry_async_does_not_retry():
+    attempt_counter = 0
+
+    @retry(do_not_retry_exceptions=[ValueError], max_retry_duration=3, base_retry_count=3)
+    async def always_fail():
+        nonlocal attempt_counter
+        attempt_counter += 1
+        raise ValueError("Intentional failure")
+
+    with pytest.raises(ValueError):
+        asyncio.run(always_fail())
+    assert attempt_counter == 1
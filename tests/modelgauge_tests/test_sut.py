@@ -0,0 +1,13 @@
+import asyncio
+
+from modelgauge_tests.fake_sut import FakeSUT, FakeSUTRequest, FakeSUTResponse
+
+
+def test_default_aevaluate_runs_sync_evaluate():
+    sut = FakeSUT()
+    request = FakeSUTRequest(text="some text")
+
+    response = asyncio.run(sut.aevaluate(request))
+
+    assert response == FakeSUTResponse(text="some text")
+    assert sut.evaluate_calls == 1